@@ -0,0 +1,47 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled implementations of AlterCycle's hottest inner loops.
+
+Built optionally by setup.py when Cython is available; linked_list falls
+back to its pure-Python/NumPy paths when this module isn't importable.
+"""
+
+
+def count_windows(const unsigned long long[::1] codes, Py_ssize_t pattern_length):
+    """
+    Count every cyclic window of pattern_length codes.
+
+    Windows are fingerprinted with the same 64-bit polynomial hash as
+    the pure-Python fallback, but the loop runs entirely in C with
+    native integer arithmetic. Before a repeated fingerprint is
+    counted, the window is compared code-by-code against the stored
+    first occurrence; on any mismatch the result would no longer be
+    exact, so the function bails out and lets the caller recount with
+    exact keys.
+
+    Returns:
+        Tuple of (fingerprint -> count dict,
+        fingerprint -> first window start dict), or None if two
+        distinct windows collided on a fingerprint
+    """
+    cdef Py_ssize_t n = codes.shape[0]
+    cdef Py_ssize_t i, j, offset
+    cdef unsigned long long window_hash
+    cdef unsigned long long prime = 1099511628211ULL
+    counts = {}
+    first_index = {}
+    for i in range(n):
+        window_hash = codes[i]
+        for offset in range(1, pattern_length):
+            window_hash = window_hash * prime + codes[(i + offset) % n]
+        first = first_index.get(window_hash)
+        if first is None:
+            counts[window_hash] = 1
+            first_index[window_hash] = i
+        else:
+            j = first
+            for offset in range(pattern_length):
+                if codes[(i + offset) % n] != codes[(j + offset) % n]:
+                    return None
+            counts[window_hash] = counts[window_hash] + 1
+    return counts, first_index
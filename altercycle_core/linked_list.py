@@ -1,11 +1,44 @@
-from typing import Any, Optional, Iterator, TypeVar, Generic, List, Tuple, Callable
-from collections import deque
-from .node import AlterNode
+from typing import Any, Optional, Iterable, Iterator, TypeVar, Generic, List, Tuple, Callable
+from collections import Counter, deque
+from .node import AlterNode, _EMPTY
+import array
+import concurrent.futures
+import json
+import os
 import threading
 import time
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional accelerator for checkpoints
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is an optional accelerator, not a hard dependency
+    np = None
+
+try:
+    import xxhash
+except ImportError:  # xxhash is an optional accelerator for pattern counting
+    xxhash = None
+
+try:
+    from . import _speedups
+except ImportError:  # compiled extension; built only when Cython is available
+    _speedups = None
+
 T = TypeVar('T')
 
+# Sentinel stored in a node's data slot by remove(); the node stays linked
+# (so in-flight readers never follow a dangling pointer) until compact()
+# physically unlinks it.
+_TOMBSTONE = object()
+
+# Shared worker pool for process_parallel; reusing one executor avoids
+# paying thread start-up on every call.
+_pool = concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count())
+
 class AlterCycle(Generic[T]):
     """
     A specialized data structure for handling alternating binary states in cyclic sequences.
@@ -24,8 +57,17 @@ class AlterCycle(Generic[T]):
     def __init__(self) -> None:
         """Initialize an empty AlterCycle."""
         self.head: Optional[AlterNode[T]] = None
+        self._tail: Optional[AlterNode[T]] = None
         self._lock = threading.Lock()
         self._size: int = 0
+        # Bumped by compact(); _walk snapshots it so a lock-free reader
+        # whose snapshot head gets unlinked can stop instead of
+        # spinning in the old ring forever
+        self._compactions: int = 0
+        # First node per data value, for O(1) find(); entries can go
+        # stale (removal, in-place transformation), so find() verifies
+        # before trusting one and falls back to a ring scan.
+        self._by_data: dict = {}
         
     def append(self, data: T, metadata: Optional[dict] = None) -> None:
         """
@@ -41,16 +83,71 @@ class AlterCycle(Generic[T]):
             new_node = AlterNode(data, metadata=metadata)
             if not self.head:
                 self.head = new_node
-                self.head.next = self.head
+                self._tail = new_node
+                new_node.next = new_node
             else:
-                current = self.head
-                while current.next != self.head:
-                    current = current.next
-                new_node.orientation = 1 - current.orientation
-                current.next = new_node
+                new_node.orientation = 1 - self._tail.orientation
                 new_node.next = self.head
+                self._tail.next = new_node
+                self._tail = new_node
             self._size += 1
-            
+            try:
+                self._by_data.setdefault(data, new_node)
+            except TypeError:  # unhashable data is simply not indexed
+                pass
+
+    def append_many(self, items: Iterable[T],
+                    metadata_iter: Optional[Iterable[Optional[dict]]] = None) -> None:
+        """
+        Append every item from an iterable under one lock acquisition.
+
+        Equivalent to calling append per item, but the lock is taken
+        once for the whole batch instead of once per node, removing the
+        mutex churn that dominates multi-threaded bulk inserts. The
+        batch is inserted atomically with respect to other writers.
+
+        Args:
+            items: Iterable of data items to append
+            metadata_iter: Optional parallel iterable of metadata dicts
+        """
+        if metadata_iter is None:
+            pairs = ((item, None) for item in items)
+        else:
+            pairs = zip(items, metadata_iter)
+
+        with self._lock:
+            tail = self._tail
+            # Build the batch as a detached chain first: the live ring
+            # is not touched until the whole iterable has been consumed,
+            # so an iterable that raises mid-batch leaves no trace
+            orientation = 1 - tail.orientation if tail is not None else 0
+            batch: List[AlterNode] = []
+            for item, metadata in pairs:
+                new_node = AlterNode(item, metadata=metadata)
+                new_node.orientation = orientation
+                orientation ^= 1
+                if batch:
+                    batch[-1].next = new_node
+                batch.append(new_node)
+            if not batch:
+                return
+
+            # Splice the finished chain into the ring with two writes
+            first, last = batch[0], batch[-1]
+            if self.head is None:
+                self.head = first
+                last.next = first
+            else:
+                last.next = self.head
+                tail.next = first
+            self._tail = last
+            self._size += len(batch)
+            for new_node in batch:
+                try:
+                    self._by_data.setdefault(new_node.data, new_node)
+                except TypeError:  # unhashable data is simply not indexed
+                    pass
+
     def insert_after(self, target_data: T, new_data: T) -> bool:
         """
         Insert a new node after the first occurrence of target_data.
@@ -73,7 +170,13 @@ class AlterCycle(Generic[T]):
                     new_node.next = current.next
                     new_node.orientation = 1 - current.orientation
                     current.next = new_node
+                    if current is self._tail:
+                        self._tail = new_node
                     self._size += 1
+                    try:
+                        self._by_data.setdefault(new_data, new_node)
+                    except TypeError:
+                        pass
                     return True
                 current = current.next
                 if current == self.head:
@@ -83,143 +186,540 @@ class AlterCycle(Generic[T]):
     def remove(self, data: T) -> bool:
         """
         Remove the first occurrence of a node with the given data.
-        
+
+        The node is tombstoned rather than unlinked, so concurrent
+        readers traversing the ring never see a broken link; traversal
+        methods skip tombstones, and compact() reclaims them.
+
         Args:
             data: Data to remove
-            
+
         Returns:
             bool: True if removal was successful
         """
         with self._lock:
             if not self.head:
                 return False
-                
-            if self.head.data == data:
-                if self.head.next == self.head:
-                    self.head = None
-                else:
-                    current = self.head
-                    while current.next != self.head:
-                        current = current.next
-                    current.next = self.head.next
-                    self.head = self.head.next
-                self._size -= 1
-                return True
-                
+
             current = self.head
-            while current.next != self.head:
-                if current.next.data == data:
-                    current.next = current.next.next
+            while True:
+                node_data = current.data
+                if node_data is not _TOMBSTONE and node_data == data:
+                    current.data = _TOMBSTONE
+                    current.metadata = _EMPTY
+                    try:
+                        if self._by_data.get(data) is current:
+                            del self._by_data[data]
+                    except TypeError:
+                        pass
                     self._size -= 1
+                    if self._size == 0:
+                        self.head = None
+                        self._tail = None
+                    elif current is self._tail:
+                        # Retreat the tail to the last live node so the
+                        # next append alternates from a live orientation
+                        # instead of reading the tombstone's
+                        node = self.head
+                        last_live = None
+                        while True:
+                            if node.data is not _TOMBSTONE:
+                                last_live = node
+                            node = node.next
+                            if node is self.head:
+                                break
+                        self._tail = last_live
                     return True
                 current = current.next
-            return False
+                if current is self.head:
+                    return False
+
+    def compact(self) -> None:
+        """
+        Physically unlink the tombstoned nodes left behind by remove().
+
+        Rewires the ring to contain only live nodes; call periodically
+        after heavy removal to reclaim node memory.
+        """
+        with self._lock:
+            if not self.head:
+                return
+
+            live = []
+            current = self.head
+            while True:
+                if current.data is not _TOMBSTONE:
+                    live.append(current)
+                current = current.next
+                if current is self.head:
+                    break
+
+            if not live:
+                self.head = None
+                self._tail = None
+            else:
+                for node, successor in zip(live, live[1:]):
+                    node.next = successor
+                live[-1].next = live[0]
+                self.head = live[0]
+                self._tail = live[-1]
+            self._compactions += 1
             
     def flip_states(self, positions: int = 1) -> None:
         """
         Flip binary states for a specified number of positions.
-        
+
+        Each position is one full pass flipping every node, so passes
+        cancel in pairs: even counts leave the cycle unchanged and odd
+        counts collapse to a single XOR pass over the ring.
+
         Args:
             positions: Number of positions to flip states
         """
-        if not self.head or positions == 0:
+        if not self.head or positions % 2 == 0:
             return
-            
-        current = self.head
-        for _ in range(abs(positions)):
-            while True:
-                current.flip_orientation()
-                current = current.next
-                if current == self.head:
-                    break
+
+        head = self.head
+        current = head
+        while True:
+            current.orientation ^= 1
+            current = current.next
+            if current is head:
+                break
                     
+    def _walk(self) -> Iterator['AlterNode[T]']:
+        """
+        Yield every live node in the ring exactly once, starting at head.
+
+        Works from a local snapshot of head and takes no lock: remove()
+        only tombstones, so traversal can proceed concurrently with
+        writers. compact(), however, does unlink nodes — if it runs
+        mid-walk the snapshot head may no longer be in the ring and the
+        walk could spin forever, so the walk watches the compaction
+        counter and stops short instead, the same truncation semantics
+        items_list has under concurrent mutation. Tombstoned nodes are
+        skipped.
+        """
+        expected = self._compactions
+        head = self.head
+        if head is None:
+            return
+
+        current = head
+        while True:
+            if current.data is not _TOMBSTONE:
+                yield current
+            if self._compactions != expected:
+                break
+            current = current.next
+            if current is head:
+                break
+
+    def find(self, data: T) -> Optional['AlterNode[T]']:
+        """
+        Return the first live node holding the given data, or None.
+
+        Backed by a hash index maintained on insertion, so the common
+        case is a single dict lookup instead of an O(N) ring scan. When
+        the indexed node has been removed or its data transformed in
+        place, the scan fallback still finds the current first
+        occurrence.
+
+        Args:
+            data: Data to look up
+
+        Returns:
+            The matching AlterNode, or None if no node holds data
+        """
+        try:
+            node = self._by_data.get(data)
+        except TypeError:  # unhashable data is never indexed
+            node = None
+        if (node is not None and node.data is not _TOMBSTONE
+                and node.data == data):
+            return node
+
+        for node in self._walk():
+            if node.data == data:
+                return node
+        return None
+
+    def items_list(self) -> Tuple[List[T], List[int]]:
+        """
+        Snapshot the cycle into parallel (data, orientations) lists.
+
+        A tight local-variable loop filling preallocated lists; whole-
+        cycle consumers use this instead of iterating node by node,
+        avoiding per-step generator frames and tuple allocations.
+
+        Returns:
+            Tuple of (data list, orientation list)
+        """
+        size = self._size
+        data: List[T] = [None] * size
+        orientations: List[int] = [0] * size
+        head = self.head
+        if head is None:
+            return data, orientations
+
+        current = head
+        i = 0
+        while True:
+            value = current.data
+            if value is not _TOMBSTONE and i < size:
+                data[i] = value
+                orientations[i] = current.orientation
+                i += 1
+            current = current.next
+            if current is head:
+                break
+        if i != size:  # concurrent mutation during the snapshot
+            del data[i:]
+            del orientations[i:]
+        return data, orientations
+
+    def items_arrays(self) -> Tuple['np.ndarray', 'np.ndarray']:
+        """
+        Snapshot the cycle into parallel NumPy arrays.
+
+        Returns:
+            Tuple of (data array with dtype=object, orientation array
+            with dtype=int8), both of length len(self)
+
+        Raises:
+            RuntimeError: If NumPy is not installed
+        """
+        if np is None:
+            raise RuntimeError("items_arrays requires NumPy")
+        size = self._size
+        data = np.empty(size, dtype=object)
+        orientations = np.empty(size, dtype=np.int8)
+        i = 0
+        for node in self._walk():
+            if i >= size:
+                break
+            data[i] = node.data
+            orientations[i] = node.orientation
+            i += 1
+        if i != size:  # concurrent mutation during the snapshot
+            data = data[:i]
+            orientations = orientations[:i]
+        return data, orientations
+
     def find_patterns(self, pattern_length: int) -> List[Tuple[List[T], int]]:
         """
         Detect recurring patterns in alternating sequences.
-        
+
         Args:
             pattern_length: Length of patterns to search for
-            
+
         Returns:
             List of (pattern, frequency) tuples
         """
         if not self.head or pattern_length > len(self):
             return []
-            
-        patterns = {}
-        current = self.head
-        
-        while True:
-            pattern = []
-            node = current
-            for _ in range(pattern_length):
-                pattern.append((node.data, node.orientation))
-                node = node.next
-            pattern_tuple = tuple(pattern)
-            patterns[pattern_tuple] = patterns.get(pattern_tuple, 0) + 1
-            current = current.next
-            if current == self.head:
-                break
-                
-        return [(list(p), f) for p, f in patterns.items() if f > 1]
+
+        if _speedups is not None:
+            return self._find_patterns_compiled(pattern_length)
+        if np is not None:
+            return self._find_patterns_vectorized(pattern_length)
+
+        # Pure-Python fallback: windows are fingerprinted with a rolling
+        # 64-bit polynomial hash over packed integer codes, so no tuple
+        # is built or hashed per window.
+        codes_list, symbols = self._symbol_codes()
+        codes = array.array('Q', codes_list)
+        n = len(codes)
+        mask = (1 << 64) - 1
+        prime = 1099511628211
+
+        hashes = [0] * n
+        for i in range(n):
+            window_hash = codes[i]
+            for offset in range(1, pattern_length):
+                window_hash = (window_hash * prime +
+                               codes[(i + offset) % n]) & mask
+            hashes[i] = window_hash
+
+        counts = Counter(hashes)
+        first_index = self._first_occurrences(hashes, counts)
+        if not self._collision_free(codes, hashes, first_index,
+                                    pattern_length):
+            counts, first_index = self._exact_counts(codes, n, pattern_length)
+        return self._decode_repeated(codes, symbols, counts, first_index,
+                                     pattern_length)
+
+    def _find_patterns_compiled(self, pattern_length: int) -> List[Tuple[List[T], int]]:
+        """
+        Compiled-extension implementation of find_patterns.
+
+        Encodes the ring through the shared alphabet and hands the
+        window-counting loop to the _speedups Cython kernel, which runs
+        it with native integer arithmetic. The kernel verifies repeated
+        fingerprints against their first occurrence and reports a
+        collision by returning None, in which case counting is redone
+        with exact window-tuple keys.
+
+        Args:
+            pattern_length: Length of patterns to search for
+
+        Returns:
+            List of (pattern, frequency) tuples
+        """
+        codes_list, symbols = self._symbol_codes()
+        codes = array.array('Q', codes_list)
+        result = _speedups.count_windows(codes, pattern_length)
+        if result is None:  # fingerprint collision between distinct windows
+            counts, first_index = self._exact_counts(
+                codes, len(codes), pattern_length)
+        else:
+            counts, first_index = result
+        return self._decode_repeated(codes, symbols, counts, first_index,
+                                     pattern_length)
+
+    @staticmethod
+    def _collision_free(codes, hashes: List[int], first_index: dict,
+                        pattern_length: int) -> bool:
+        """
+        Verify that no two distinct windows share a fingerprint.
+
+        Compares every window whose fingerprint repeats against the
+        stored first occurrence, code by code — the memcmp step that
+        keeps the fingerprinting paths exact rather than probabilistic.
+        Costs one pass over the repeated windows, which the decode step
+        pays for anyway.
+        """
+        n = len(codes)
+        for i, window_hash in enumerate(hashes):
+            j = first_index.get(window_hash)
+            if j is None or j == i:
+                continue
+            for offset in range(pattern_length):
+                if codes[(i + offset) % n] != codes[(j + offset) % n]:
+                    return False
+        return True
+
+    @staticmethod
+    def _exact_counts(codes, num_windows: int,
+                      pattern_length: int) -> Tuple[dict, dict]:
+        """
+        Count windows keyed by their exact code tuples.
+
+        Collision fallback for the fingerprinting paths: slower (one
+        tuple build and hash per window) but cannot merge distinct
+        windows.
+        """
+        n = len(codes)
+        counts: dict = {}
+        first_index: dict = {}
+        for i in range(num_windows):
+            key = tuple(codes[(i + offset) % n]
+                        for offset in range(pattern_length))
+            counts[key] = counts.get(key, 0) + 1
+            first_index.setdefault(key, i)
+        return counts, first_index
+
+    @staticmethod
+    def _first_occurrences(hashes: List[int], counts: Counter) -> dict:
+        """Locate the first window start for every repeated fingerprint."""
+        repeated = {h for h, count in counts.items() if count > 1}
+        first_index: dict = {}
+        for i, window_hash in enumerate(hashes):
+            if window_hash in repeated and window_hash not in first_index:
+                first_index[window_hash] = i
+                if len(first_index) == len(repeated):
+                    break
+        return first_index
+
+    @staticmethod
+    def _decode_repeated(codes: 'array.array', symbols: List[Tuple[T, int]],
+                         counts: dict, first_index: dict,
+                         pattern_length: int) -> List[Tuple[List[T], int]]:
+        """Expand fingerprint counts back into (pattern, frequency) tuples."""
+        n = len(codes)
+        results = []
+        for window_hash, count in counts.items():
+            if count > 1:
+                start = first_index[window_hash]
+                results.append(
+                    ([symbols[codes[(start + offset) % n]]
+                      for offset in range(pattern_length)], count))
+        return results
+
+    def _symbol_codes(self) -> Tuple[List[int], List[Tuple[T, int]]]:
+        """
+        Map every node to an integer code.
+
+        Builds an alphabet assigning one code per distinct
+        (data, orientation) pair, so pattern machinery can work on plain
+        ints instead of Python tuples.
+
+        Returns:
+            Tuple of (per-node code list, code -> (data, orientation)
+            symbol table)
+        """
+        alphabet: dict = {}
+        symbols: List[Tuple[T, int]] = []
+        codes: List[int] = []
+        append = codes.append
+        for node in self._walk():
+            key = (node.data, node.orientation)
+            code = alphabet.get(key)
+            if code is None:
+                code = len(symbols)
+                alphabet[key] = code
+                symbols.append(key)
+            append(code)
+        return codes, symbols
+
+    def _find_patterns_vectorized(self, pattern_length: int) -> List[Tuple[List[T], int]]:
+        """
+        NumPy implementation of find_patterns.
+
+        The ring is flattened once into a contiguous array of integer
+        codes (one code per distinct (data, orientation) pair), every
+        cyclic window is produced with a single stride trick, and the
+        counting happens in np.unique rather than a Python loop.
+
+        Args:
+            pattern_length: Length of patterns to search for
+
+        Returns:
+            List of (pattern, frequency) tuples
+        """
+        codes_list, symbols = self._symbol_codes()
+        codes = np.asarray(codes_list, dtype=np.intp)
+
+        num_windows = codes.shape[0]
+        if pattern_length > 1:
+            codes = np.concatenate([codes, codes[:pattern_length - 1]])
+
+        if xxhash is not None:
+            # One 64-bit xxhash over the window's raw bytes replaces the
+            # O(k) tuple build plus Python tuple hashing per window, and
+            # Counter accumulates the digests at C level.
+            width = codes.itemsize
+            buffer = memoryview(codes).cast('B')
+            digest = xxhash.xxh64_intdigest
+            hashes = [digest(buffer[i * width:(i + pattern_length) * width])
+                      for i in range(num_windows)]
+            counts = Counter(hashes)
+            first_index = self._first_occurrences(hashes, counts)
+            if not self._collision_free(codes, hashes, first_index,
+                                        pattern_length):
+                counts, first_index = self._exact_counts(
+                    codes, num_windows, pattern_length)
+            return self._decode_repeated(codes, symbols, counts, first_index,
+                                         pattern_length)
+
+        windows = np.lib.stride_tricks.sliding_window_view(codes, pattern_length)
+        rows, counts = np.unique(windows, axis=0, return_counts=True)
+
+        return [([symbols[code] for code in row], int(count))
+                for row, count in zip(rows, counts) if count > 1]
         
-    def process_parallel(self, func: Callable[[T, int], None], 
-                        num_threads: int = 4) -> None:
+    def process_parallel(self, func: Callable[[T, int], None],
+                        num_threads: Optional[int] = None) -> None:
         """
         Process nodes in parallel using multiple threads.
-        
+
+        Note: for pure-Python callables the GIL serializes the actual
+        work, so this mainly helps when func releases the GIL (I/O,
+        C extensions). For numeric kernels prefer process_parallel_njit,
+        which runs compiled code on all cores.
+
         Args:
             func: Function to apply to each node (params: data, state)
-            num_threads: Number of threads to use
+            num_threads: Number of threads to use (defaults to CPU count)
         """
         if not self.head:
             return
+
+        if num_threads is None:
+            num_threads = os.cpu_count() or 4
             
-        def worker(start_node: AlterNode[T], count: int) -> None:
-            current = start_node
-            for _ in range(count):
-                func(current.data, current.orientation)
-                current = current.next
-                
-        length = len(self)
+        def worker(chunk: List['AlterNode[T]']) -> None:
+            for node in chunk:
+                func(node.data, node.orientation)
+
+        # Materialize the ring once and hand each worker a list slice:
+        # no worker ever follows shared next pointers, and sequential
+        # index access beats pointer chasing through the ring.
+        nodes = list(self._walk())
+        length = len(nodes)
         nodes_per_thread = length // num_threads
-        threads = []
-        current = self.head
-        
+        chunks = []
+        start = 0
         for i in range(num_threads):
             count = nodes_per_thread + (1 if i < length % num_threads else 0)
-            thread = threading.Thread(target=worker, args=(current, count))
-            threads.append(thread)
-            thread.start()
-            for _ in range(count):
-                current = current.next
-                
-        for thread in threads:
-            thread.join()
-            
+            if count:
+                chunks.append(nodes[start:start + count])
+                start += count
+
+        futures = [_pool.submit(worker, chunk) for chunk in chunks]
+        for future in futures:
+            future.result()
+
+    def process_parallel_njit(self, kernel: Callable) -> None:
+        """
+        Process the cycle with a compiled parallel kernel.
+
+        The cycle is materialized into contiguous data/orientation
+        arrays and the kernel is invoked once over both. A kernel
+        decorated with numba.njit(parallel=True) that iterates with
+        numba.prange executes LLVM-compiled code outside the GIL, so
+        throughput scales with core count — unlike the thread fan-out in
+        process_parallel, which the GIL serializes for Python callables.
+
+        Args:
+            kernel: Callable accepting (data_array, orientation_array),
+                typically decorated with numba.njit(parallel=True)
+
+        Raises:
+            RuntimeError: If NumPy is not installed
+        """
+        if np is None:
+            raise RuntimeError("process_parallel_njit requires NumPy")
+        if not self.head:
+            return
+
+        data, orientations = self.items_arrays()
+        try:
+            numeric = np.array(data.tolist())
+        except ValueError:  # ragged data cannot form an array
+            numeric = None
+        if numeric is not None and np.issubdtype(numeric.dtype, np.number):
+            kernel(numeric, orientations)
+        else:
+            kernel(data, orientations)
+
     def create_checkpoint(self) -> str:
         """
-        Create a serializable checkpoint of the current state sequence.
-        
+        Create a JSON checkpoint of the current state sequence.
+
+        The cycle is stored as three parallel lists (data, orientation,
+        metadata) instead of one dict per node, and serialized with
+        orjson when available (stdlib json otherwise).
+
         Returns:
-            str: JSON-serializable checkpoint data
+            str: JSON checkpoint data
         """
+        data, orientations = self.items_list()
+        # The shared empty-metadata proxy isn't JSON serializable; swap
+        # it for one shared plain dict.
+        no_metadata: dict = {}
+        metadata = [node.metadata if node.metadata is not _EMPTY else no_metadata
+                    for node in self._walk()]
+
         checkpoint = {
-            'nodes': [],
-            'timestamp': time.time()
+            'timestamp': time.time(),
+            'data': data,
+            'orientation': orientations,
+            'metadata': metadata
         }
-        if self.head:
-            current = self.head
-            while True:
-                checkpoint['nodes'].append({
-                    'data': current.data,
-                    'orientation': current.orientation,
-                    'metadata': current.metadata
-                })
-                current = current.next
-                if current == self.head:
-                    break
-        return str(checkpoint)
+        if orjson is not None:
+            return orjson.dumps(checkpoint).decode()
+        return json.dumps(checkpoint)
         
     def apply_transformation(self, transform_func: Callable[[T, int], T]) -> None:
         """
@@ -228,42 +728,63 @@ class AlterCycle(Generic[T]):
         Args:
             transform_func: Function that takes (data, state) and returns new data
         """
+        for node in self._walk():
+            node.data = transform_func(node.data, node.orientation)
+        # In-place data rewrites invalidate the find() index wholesale
+        self._by_data.clear()
+
+    def apply_transformation_vectorized(self, kernel: Callable) -> None:
+        """
+        Apply a whole-array transformation kernel to all nodes at once.
+
+        The cycle is snapshotted into contiguous data/orientation arrays,
+        the kernel is invoked once on the full arrays (a np.ufunc or a
+        Numba @njit function), and the results are written back to the
+        nodes. For data that does not coerce to a numeric dtype, or when
+        NumPy is unavailable, the kernel is applied per node instead.
+
+        Note: the snapshot is taken without holding the internal lock;
+        callers mutating the cycle concurrently should synchronize
+        externally.
+
+        Args:
+            kernel: Callable mapping (data_array, orientation_array) to
+                a new data array (or (data, orientation) to new data in
+                the per-node fallback)
+        """
         if not self.head:
             return
-            
-        current = self.head
-        while True:
-            current.data = transform_func(current.data, current.orientation)
-            current = current.next
-            if current == self.head:
-                break
-                
+
+        if np is not None:
+            data, orientations = self.items_arrays()
+            try:
+                numeric = np.array(data.tolist())
+            except ValueError:  # ragged data cannot form an array
+                numeric = None
+            if numeric is not None and np.issubdtype(numeric.dtype, np.number):
+                results = np.asarray(kernel(numeric, orientations)).tolist()
+                for node, value in zip(self._walk(), results):
+                    node.data = value
+                self._by_data.clear()
+                return
+
+        for node in self._walk():
+            node.data = kernel(node.data, node.orientation)
+        self._by_data.clear()
+
     def __iter__(self) -> Iterator[Tuple[T, int]]:
         """Iterator yielding (data, state) tuples."""
-        if not self.head:
-            return
-            
-        current = self.head
-        while True:
-            yield (current.data, current.orientation)
-            current = current.next
-            if current == self.head:
-                break
-                
+        for node in self._walk():
+            yield (node.data, node.orientation)
+
     def __len__(self) -> int:
         """Return the number of nodes in the sequence."""
         return self._size
         
     def __repr__(self) -> str:
         """Detailed string representation including metadata."""
-        if not self.head:
-            return "AlterCycle([])"
-        nodes = []
-        current = self.head
-        while True:
-            meta_str = f"::{current.metadata}" if current.metadata else ""
-            nodes.append(f"{current.data}({current.orientation}{meta_str})")
-            current = current.next
-            if current == self.head:
-                break
-        return "AlterCycle([" + " -> ".join(nodes) + "])"
+        data, orientations = self.items_list()
+        metadata = [node.metadata for node in self._walk()]
+        parts = [f"{d}({s}::{m})" if m else f"{d}({s})"
+                 for d, s, m in zip(data, orientations, metadata)]
+        return "AlterCycle([" + " -> ".join(parts) + "])"
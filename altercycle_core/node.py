@@ -1,7 +1,13 @@
-from typing import Any, Optional, TypeVar
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, TypeVar
 
 T = TypeVar('T')
 
+# Shared read-only stand-in for "no metadata": nodes created without
+# metadata all reference this single proxy instead of allocating their
+# own empty dict; add_metadata swaps in a real dict on first write.
+_EMPTY: Mapping = MappingProxyType({})
+
 class AlterNode:
     """
     A node in an AlterCycle that maintains binary state alternation.
@@ -15,7 +21,9 @@ class AlterNode:
         next: Reference to the next node in the sequence
         metadata: Optional dictionary for storing additional node information
     """
-    
+
+    __slots__ = ('data', 'orientation', 'next', 'metadata')
+
     def __init__(self, data: T, orientation: int = 0, metadata: Optional[dict] = None) -> None:
         """
         Initialize a new AlterNode.
@@ -34,7 +42,7 @@ class AlterNode:
         self.data: T = data
         self.orientation: int = orientation
         self.next: Optional['AlterNode'] = None
-        self.metadata: dict = metadata or {}
+        self.metadata: Mapping = _EMPTY if metadata is None else metadata
         
     def flip_orientation(self) -> None:
         """Invert the node's orientation."""
@@ -48,6 +56,8 @@ class AlterNode:
             key: Metadata key
             value: Metadata value
         """
+        if self.metadata is _EMPTY:
+            self.metadata = {}
         self.metadata[key] = value
         
     def get_metadata(self, key: str) -> Any:
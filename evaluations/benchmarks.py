@@ -5,12 +5,56 @@ import statistics
 from typing import List, Tuple, Any, Dict
 from collections import deque
 from concurrent.futures import ThreadPoolExecutor
-import matplotlib.pyplot as plt
-import numpy as np
-from mobius_linked_list import MobiusLinkedList
+from altercycle_core import AlterCycle
+
+
+def _time(fn, repeat: int = 5, warmup: int = 1) -> float:
+    """
+    Time a callable and return the median of several runs in seconds.
+
+    The callable is invoked warmup times untimed first, so one-off costs
+    (JIT compilation, cold caches) don't pollute the measurement, then
+    the median of repeat time.perf_counter_ns() deltas is taken.
+    perf_counter_ns is monotonic and high resolution, unlike time.time().
+    """
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        fn()
+        samples.append(time.perf_counter_ns() - start)
+    return statistics.median(samples) / 1e9
+
+
+def _deep_size(obj) -> int:
+    """
+    Approximate the retained size of an object graph in bytes.
+
+    Fallback for when pympler isn't installed: walks referents with gc,
+    summing sys.getsizeof and skipping classes and modules so shared
+    type objects aren't charged to the instance.
+    """
+    import gc
+    import sys
+    import types
+
+    seen = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+        stack.extend(ref for ref in gc.get_referents(current)
+                     if not isinstance(ref, (type, types.ModuleType)))
+    return total
+
 
 class DataStructureEvaluation:
-    """Comprehensive evaluation suite for the Möbius Linked List."""
+    """Comprehensive evaluation suite for the AlterCycle."""
     
     def __init__(self, sizes: List[int] = [100, 1000, 10000, 100000]):
         self.sizes = sizes
@@ -23,38 +67,27 @@ class DataStructureEvaluation:
         
     def benchmark_insertion(self) -> Dict[str, List[float]]:
         """Compare insertion performance."""
-        results = {'mobius': [], 'deque': [], 'list': []}
+        results = {'altercycle': [], 'deque': [], 'list': []}
         
+        def fill(structure, data):
+            append = structure.append
+            for item in data:
+                append(item)
+
         for size in self.sizes:
             data = self.generate_data(size)
-            
-            # Möbius Linked List
-            start = time.time()
-            mlist = MobiusLinkedList[str]()
-            for item in data:
-                mlist.append(item)
-            results['mobius'].append(time.time() - start)
-            
-            # Deque
-            start = time.time()
-            dq = deque()
-            for item in data:
-                dq.append(item)
-            results['deque'].append(time.time() - start)
-            
-            # Regular List
-            start = time.time()
-            lst = []
-            for item in data:
-                lst.append(item)
-            results['list'].append(time.time() - start)
-            
+
+            results['altercycle'].append(
+                _time(lambda: fill(AlterCycle[str](), data)))
+            results['deque'].append(_time(lambda: fill(deque(), data)))
+            results['list'].append(_time(lambda: fill([], data)))
+
         self.results['insertion'] = results
         return results
         
     def benchmark_pattern_detection(self) -> Dict[str, List[float]]:
         """Compare pattern detection performance."""
-        results = {'mobius': [], 'traditional': []}
+        results = {'altercycle': [], 'traditional': []}
         pattern_length = 2
         
         def find_patterns_traditional(data: List[str], length: int) -> List[Tuple[List[str], int]]:
@@ -67,25 +100,23 @@ class DataStructureEvaluation:
         for size in self.sizes:
             data = self.generate_data(size)
             
-            # Möbius Linked List
-            mlist = MobiusLinkedList[str]()
+            # AlterCycle
+            mlist = AlterCycle[str]()
             for item in data:
                 mlist.append(item)
-            start = time.time()
-            mlist.find_patterns(pattern_length)
-            results['mobius'].append(time.time() - start)
-            
+            results['altercycle'].append(
+                _time(lambda: mlist.find_patterns(pattern_length)))
+
             # Traditional approach
-            start = time.time()
-            find_patterns_traditional(data, pattern_length)
-            results['traditional'].append(time.time() - start)
+            results['traditional'].append(
+                _time(lambda: find_patterns_traditional(data, pattern_length)))
             
         self.results['pattern_detection'] = results
         return results
         
     def benchmark_concurrent_operations(self) -> Dict[str, List[float]]:
         """Compare concurrent operation performance."""
-        results = {'mobius': [], 'synchronized_list': []}
+        results = {'altercycle': [], 'synchronized_list': []}
         num_threads = 4
         operations_per_thread = 1000
         
@@ -98,63 +129,77 @@ class DataStructureEvaluation:
                 with self.lock:
                     self.data.append(item)
         
-        for size in self.sizes:
-            # Möbius Linked List
-            mlist = MobiusLinkedList[str]()
-            start = time.time()
+        def hammer(structure):
+            if hasattr(structure, 'append_many'):
+                # Batch API: one lock acquisition per thread, not per item
+                task = lambda: structure.append_many(
+                    str(i) for i in range(operations_per_thread))
+            else:
+                task = lambda: [structure.append(str(i))
+                                for i in range(operations_per_thread)]
             with ThreadPoolExecutor(max_workers=num_threads) as executor:
-                futures = []
-                for _ in range(num_threads):
-                    futures.append(executor.submit(
-                        lambda: [mlist.append(str(i)) for i in range(operations_per_thread)]
-                    ))
+                futures = [executor.submit(task) for _ in range(num_threads)]
                 for future in futures:
                     future.result()
-            results['mobius'].append(time.time() - start)
-            
-            # Synchronized List
-            slist = SynchronizedList()
-            start = time.time()
-            with ThreadPoolExecutor(max_workers=num_threads) as executor:
-                futures = []
-                for _ in range(num_threads):
-                    futures.append(executor.submit(
-                        lambda: [slist.append(str(i)) for i in range(operations_per_thread)]
-                    ))
-                for future in futures:
-                    future.result()
-            results['synchronized_list'].append(time.time() - start)
+
+        for size in self.sizes:
+            results['altercycle'].append(
+                _time(lambda: hammer(AlterCycle[str]())))
+            results['synchronized_list'].append(
+                _time(lambda: hammer(SynchronizedList())))
             
         self.results['concurrent_operations'] = results
         return results
         
     def benchmark_memory_usage(self) -> Dict[str, List[float]]:
-        """Compare memory usage."""
-        import sys
-        results = {'mobius': [], 'deque': [], 'list': []}
-        
+        """
+        Compare retained (deep) memory usage.
+
+        sys.getsizeof alone reports only the shallow size of the
+        container object - a constant regardless of element count - so
+        the comparison uses pympler.asizeof, which traverses the whole
+        object graph, with a dependency-free walker as fallback.
+        """
+        try:
+            from pympler import asizeof
+
+            def deep_size(obj):
+                # The default recursion limit (100) truncates long node
+                # chains, undercounting the linked structure.
+                return asizeof.asizeof(obj, limit=2 ** 30)
+        except ImportError:
+            deep_size = _deep_size
+        results = {'altercycle': [], 'deque': [], 'list': []}
+
         for size in self.sizes:
             data = self.generate_data(size)
-            
-            # Möbius Linked List
-            mlist = MobiusLinkedList[str]()
+
+            # AlterCycle
+            mlist = AlterCycle[str]()
             for item in data:
                 mlist.append(item)
-            results['mobius'].append(sys.getsizeof(mlist) / 1024)  # KB
-            
+            results['altercycle'].append(deep_size(mlist) / 1024)  # KB
+
             # Deque
             dq = deque(data)
-            results['deque'].append(sys.getsizeof(dq) / 1024)
-            
+            results['deque'].append(deep_size(dq) / 1024)
+
             # Regular List
             lst = list(data)
-            results['list'].append(sys.getsizeof(lst) / 1024)
-            
+            results['list'].append(deep_size(lst) / 1024)
+
         self.results['memory_usage'] = results
         return results
         
     def plot_results(self) -> None:
         """Generate performance comparison plots."""
+        # Imported lazily: matplotlib costs hundreds of milliseconds and
+        # tens of MB, and benchmarks are often run without plotting. Agg
+        # keeps headless/CI runs from touching a display.
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+
         fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
         
         # Insertion Performance
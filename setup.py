@@ -1,5 +1,14 @@
 from setuptools import setup, find_packages
 
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        ["altercycle_core/_speedups.pyx"], language_level=3)
+except ImportError:
+    # The compiled speedups are optional; the package is fully
+    # functional in pure Python.
+    ext_modules = []
+
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
@@ -13,6 +22,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/altercycle",
     packages=find_packages(),
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Developers",